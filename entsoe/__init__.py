@@ -1,2 +1,3 @@
 from .entsoe import EntsoeRawClient, EntsoePandasClient, __version__
+from .async_client import AsyncEntsoePandasClient
 from .mappings import Area
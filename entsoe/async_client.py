@@ -0,0 +1,37 @@
+import asyncio
+from functools import partial
+
+from .entsoe import EntsoePandasClient
+
+
+class AsyncEntsoePandasClient:
+    """
+    Asyncio-friendly wrapper around EntsoePandasClient.
+
+    Every query_* method of the wrapped client is exposed as a coroutine
+    that runs the blocking request/parse work on the default executor, so
+    several unrelated queries can be gathered concurrently:
+
+        client = AsyncEntsoePandasClient(api_key=...)
+        de, fr = await asyncio.gather(
+            client.query_day_ahead_prices('DE_LU', start=start, end=end),
+            client.query_day_ahead_prices('FR', start=start, end=end))
+
+    The wrapped client keeps its pooled session, so concurrent calls
+    reuse the same keep-alive connections. Accepts the same constructor
+    arguments as EntsoePandasClient.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._client = EntsoePandasClient(*args, **kwargs)
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if name.startswith('query') and callable(attr):
+            async def run(*args, _attr=attr, **kwargs):
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    None, partial(_attr, *args, **kwargs))
+            run.__name__ = name
+            return run
+        return attr
@@ -1,7 +1,8 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 from socket import gaierror
-from time import sleep
+from time import monotonic, sleep
 
 import pandas as pd
 import requests
@@ -12,6 +13,60 @@ from .misc import day_blocks, year_blocks
 logger = logging.getLogger(__name__)
 
 
+def _fetch_blocks(func, blocks, args, kwargs):
+    """Fetch one frame per (start, end) block, preserving block order.
+    Blocks that raise a NoMatchingDataError yield None. When the client
+    was created with max_concurrency > 1 the blocks are fetched on a
+    thread pool, otherwise sequentially."""
+
+    def fetch(block):
+        _start, _end = block
+        try:
+            return func(*args, start=_start, end=_end, **kwargs)
+        except NoMatchingDataError:
+            logger.debug(
+                f"NoMatchingDataError: between {_start} and {_end}"
+            )
+            return None
+
+    max_concurrency = getattr(args[0], 'max_concurrency', None)
+    if max_concurrency is not None and max_concurrency > 1 and len(blocks) > 1:
+        workers = min(max_concurrency, len(blocks))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fetch, blocks))
+    return [fetch(block) for block in blocks]
+
+
+def cached_query(func):
+    """Serves repeated identical calls from the client's in-memory cache
+    when the client was created with cache_ttl; a no-op otherwise.
+    Results are copied on the way in and out so cached frames cannot be
+    mutated through the returned objects."""
+
+    @wraps(func)
+    def cache_wrapper(*args, **kwargs):
+        self = args[0]
+        ttl = getattr(self, 'cache_ttl', None)
+        if not ttl:
+            return func(*args, **kwargs)
+        key = (func.__name__, repr(args[1:]), repr(sorted(kwargs.items())))
+        # decorated methods may run on the client's thread pool, so the
+        # dict lookups/stores are guarded; the fetch itself is not
+        with self._cache_lock:
+            hit = self._query_cache.get(key)
+            if hit is not None:
+                stored_at, result = hit
+                if monotonic() - stored_at < ttl:
+                    return result.copy()
+                del self._query_cache[key]
+        result = func(*args, **kwargs)
+        with self._cache_lock:
+            self._query_cache[key] = (monotonic(), result.copy())
+        return result
+
+    return cache_wrapper
+
+
 def retry(func):
     """Catches connection errors, waits and retries"""
 
@@ -116,36 +171,29 @@ def year_limited(func):
                 'Please use a timezoned pandas object for start and end'
             )
 
-        blocks = year_blocks(start, end)
-        frames = []
-        is_first_frame = True  # Assumes blocks are sorted
-        for _start, _end in blocks:
-            try:
-                frame = func(*args, start=_start, end=_end, **kwargs)
-                if func.__name__ != '_query_unavailability' and isinstance(frame.index, pd.DatetimeIndex):
-                    # Due to partial matching func may return data indexed by
-                    # timestamps outside _start and _end. In order to avoid
-                    # (unintentionally) repeating records, frames are truncated to
-                    # left-open intervals (or closed interval in the case of the
-                    # earliest block).
-                    #
-                    # If there are repeating records in a single frame (e.g. due
-                    # to corrections) then the result will also have them.
-                    if is_first_frame:
-                        interval_mask = frame.index <= _end
-                    else:
-                        interval_mask = (
-                            (frame.index <= _end)
-                            & (frame.index > _start)
-                        )
-                    frame = frame.loc[interval_mask]
-            except NoMatchingDataError:
-                logger.debug(
-                    f"NoMatchingDataError: between {_start} and {_end}"
-                )
-                frame = None
-            frames.append(frame)
-            is_first_frame = False
+        blocks = list(year_blocks(start, end))
+        frames = _fetch_blocks(func, blocks, args, kwargs)
+        if func.__name__ != '_query_unavailability':
+            # Due to partial matching func may return data indexed by
+            # timestamps outside _start and _end. In order to avoid
+            # (unintentionally) repeating records, frames are truncated to
+            # left-open intervals (or closed interval in the case of the
+            # earliest block). Blocks are assumed to be sorted.
+            #
+            # If there are repeating records in a single frame (e.g. due
+            # to corrections) then the result will also have them.
+            for i, (frame, (_start, _end)) in enumerate(zip(frames, blocks)):
+                if frame is None or not isinstance(
+                        frame.index, pd.DatetimeIndex):
+                    continue
+                if i == 0:
+                    interval_mask = frame.index <= _end
+                else:
+                    interval_mask = (
+                        (frame.index <= _end)
+                        & (frame.index > _start)
+                    )
+                frames[i] = frame.loc[interval_mask]
 
         if sum([f is None for f in frames]) == len(frames):
             # All the data returned are void
@@ -163,17 +211,8 @@ def day_limited(func):
 
     @wraps(func)
     def day_wrapper(*args, start, end, **kwargs):
-        blocks = day_blocks(start, end)
-        frames = []
-        for _start, _end in blocks:
-            try:
-                frame = func(*args, start=_start, end=_end, **kwargs)
-            except NoMatchingDataError:
-                logger.debug(
-                    f"NoMatchingDataError: between {_start} and {_end}"
-                )
-                frame = None
-            frames.append(frame)
+        blocks = list(day_blocks(start, end))
+        frames = _fetch_blocks(func, blocks, args, kwargs)
 
         if sum([f is None for f in frames]) == len(frames):
             # All the data returned are void
@@ -1,6 +1,13 @@
 import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from time import monotonic
+from types import MappingProxyType
 from typing import Union, Optional, Dict, List, Literal
 
+import numpy as np
 import pandas as pd
 from pandas.tseries.offsets import YearBegin, YearEnd
 import pytz
@@ -16,7 +23,7 @@ from .parsers import parse_prices, parse_loads, parse_generation, \
     parse_unavailabilities, parse_contracted_reserve, parse_imbalance_prices_zip, \
     parse_imbalance_volumes_zip, parse_netpositions, parse_procured_balancing_capacity, \
     parse_water_hydro,parse_aggregated_bids, parse_activated_balancing_energy_prices
-from .decorators import retry, paginated, year_limited, day_limited, documents_limited
+from .decorators import retry, paginated, year_limited, day_limited, documents_limited, cached_query
 import warnings
 
 logger = logging.getLogger(__name__)
@@ -29,6 +36,45 @@ __license__ = "MIT"
 
 URL = 'https://web-api.tp.entsoe.eu/api'
 
+# how long a border that returned no data for a window is skipped, in
+# seconds; recent windows get revised so the pair is retried afterwards
+_NOFLOW_TTL = 3600
+
+
+@lru_cache(maxsize=None)
+def _pytz_timezone(name: str):
+    """Resolve an Area.tz string to a pytz timezone once; the conversion
+    call sites then hand pandas a ready tzinfo instead of a string."""
+    return pytz.timezone(name)
+
+# The acknowledgement documents phrase their limits in running text and the
+# numbers sit at fixed positions from the end of the sentence. These
+# patterns pull both numbers out in a single pass; they are anchored at the
+# end of the text and mirror the token positions the .split(' ') based
+# extraction used.
+_RE_PAGINATION_ELEMENTS = re.compile(r'(\d+)\s+\S+\s+\S+\s+(\d+)\s+\S+\s*$')
+_RE_PAGINATION_OFFSET = re.compile(
+    r'(\d+)\S{2}(?:\s+\S+){20}\s+(\d+)(?:\s+\S+){8}\s*$')
+
+# Frozen parameter templates for the query methods whose parameters are
+# fully constant. Building the per-call params dict from a template saves
+# rebuilding the same literal on every (block-split) request.
+_PARAMS_DAY_AHEAD_PRICES = MappingProxyType({'documentType': 'A44'})
+_PARAMS_LOAD = MappingProxyType(
+    {'documentType': 'A65', 'processType': 'A16'})
+_PARAMS_GENERATION = MappingProxyType(
+    {'documentType': 'A75', 'processType': 'A16'})
+_PARAMS_GENERATION_PER_PLANT = MappingProxyType(
+    {'documentType': 'A73', 'processType': 'A16'})
+_PARAMS_INSTALLED_CAPACITY = MappingProxyType(
+    {'documentType': 'A68', 'processType': 'A33'})
+_PARAMS_INSTALLED_CAPACITY_PER_UNIT = MappingProxyType(
+    {'documentType': 'A71', 'processType': 'A33'})
+_PARAMS_WATER_RESERVOIRS = MappingProxyType(
+    {'documentType': 'A72', 'processType': 'A16'})
+_PARAMS_IMBALANCE_PRICES = MappingProxyType({'documentType': 'A85'})
+_PARAMS_IMBALANCE_VOLUMES = MappingProxyType({'documentType': 'A86'})
+
 
 class EntsoeRawClient:
     # noinspection LongLine
@@ -43,7 +89,8 @@ class EntsoeRawClient:
     def __init__(
             self, api_key: str, session: Optional[requests.Session] = None,
             retry_count: int = 1, retry_delay: int = 0,
-            proxies: Optional[Dict] = None, timeout: Optional[int] = None):
+            proxies: Optional[Dict] = None, timeout: Optional[int] = None,
+            max_concurrency: Optional[int] = None):
         """
         Parameters
         ----------
@@ -56,17 +103,42 @@ class EntsoeRawClient:
         proxies : dict
             requests proxies
         timeout : int
+        max_concurrency : int
+            number of sub-requests that may be issued in parallel when a
+            query is split up in blocks (e.g. per year). Defaults to
+            sequential requests, keep the ENTSO-E request rate limits in
+            mind when raising this.
         """
         if api_key is None:
             raise TypeError("API key cannot be None")
         self.api_key = api_key
         if session is None:
             session = requests.Session()
+            # the default adapter keeps only 10 pooled connections, which
+            # concurrent block fetching would exhaust; a bigger pool keeps
+            # the keep-alive connections alive across parallel workers.
+            # transient server errors and rate limiting are retried with a
+            # backoff at the transport level, below the coarser retry
+            # decorator that only handles connection failures
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=64, pool_maxsize=64,
+                max_retries=requests.adapters.Retry(
+                    total=3, backoff_factor=0.3,
+                    status_forcelist=[429, 500, 502, 503, 504]))
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
         self.session = session
+        # the security token and proxies never change during the lifetime
+        # of the client, so park them on the session instead of rebuilding
+        # them for every single request
+        self.session.params.update({'securityToken': api_key})
         self.proxies = proxies
+        if proxies is not None:
+            self.session.proxies.update(proxies)
         self.retry_count = retry_count
         self.retry_delay = retry_delay
         self.timeout = timeout
+        self.max_concurrency = max_concurrency
 
     @retry
     def _base_request(self, params: Dict, start: pd.Timestamp,
@@ -81,43 +153,59 @@ class EntsoeRawClient:
         Returns
         -------
         requests.Response
+
         """
         start_str = self._datetime_to_str(start)
         end_str = self._datetime_to_str(end)
 
         base_params = {
-            'securityToken': self.api_key,
             'periodStart': start_str,
             'periodEnd': end_str
         }
         params.update(base_params)
 
-        logger.debug(f'Performing request to {URL} with params {params}')
+        logger.debug('Performing request to %s with params %s', URL, params)
+        # no streaming: the whole body is downloaded right here, inside
+        # the retry decorator, so a connection failure mid-download is
+        # retried like any other
         response = self.session.get(url=URL, params=params,
-                                    proxies=self.proxies, timeout=self.timeout)
+                                    timeout=self.timeout)
         try:
             response.raise_for_status()
         except requests.HTTPError as e:
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # The simple error cases can be detected with a plain substring
+            # check on the body, which avoids building a parse tree for the
+            # whole acknowledgement document. Only the pagination errors need
+            # the actual <text> element contents to extract their numbers.
+            body = response.text
+            if 'No matching data found' in body:
+                raise NoMatchingDataError
+            elif "check you request against dependency tables" in body:
+                raise InvalidBusinessParameterError
+            elif "is not valid for this area" in body:
+                raise InvalidPSRTypeError
+            soup = BeautifulSoup(body, 'lxml')
             text = soup.find_all('text')
             if len(text):
                 error_text = soup.find('text').text
-                if 'No matching data found' in error_text:
-                    raise NoMatchingDataError
-                elif "check you request against dependency tables" in error_text:
-                    raise InvalidBusinessParameterError
-                elif "is not valid for this area" in error_text:
-                    raise InvalidPSRTypeError
-                elif 'amount of requested data exceeds allowed limit' in error_text:
-                    requested = error_text.split(' ')[-2]
-                    allowed = error_text.split(' ')[-5]
+                if 'amount of requested data exceeds allowed limit' in error_text:
+                    m = _RE_PAGINATION_ELEMENTS.search(error_text)
+                    if m:
+                        allowed, requested = m.groups()
+                    else:
+                        requested = error_text.split(' ')[-2]
+                        allowed = error_text.split(' ')[-5]
                     raise PaginationError(
                         f"The API is limited to {allowed} elements per "
                         f"request. This query requested for {requested} "
                         f"documents and cannot be fulfilled as is.")
                 elif 'requested data to be gathered via the offset parameter exceeds the allowed limit' in error_text:
-                    requested = error_text.split(' ')[-9]
-                    allowed = error_text.split(' ')[-30][:-2]
+                    m = _RE_PAGINATION_OFFSET.search(error_text)
+                    if m:
+                        allowed, requested = m.groups()
+                    else:
+                        requested = error_text.split(' ')[-9]
+                        allowed = error_text.split(' ')[-30][:-2]
                     raise PaginationError(
                         f"The API is limited to {allowed} elements per "
                         f"request. This query requested for {requested} "
@@ -126,19 +214,25 @@ class EntsoeRawClient:
         else:
             # ENTSO-E has changed their server to also respond with 200 if there is no data but all parameters are valid
             # this means we need to check the contents for this error even when status code 200 is returned
-            # to prevent parsing the full response do a text matching instead of full parsing
+            # to prevent parsing the full response do a bytes matching instead of full parsing,
+            # scanning response.content directly also skips decoding the whole body to str
             # also only do this when response type content is text and not for example a zip file
             if response.headers.get('content-type', '') == 'application/xml':
-                if 'No matching data found' in response.text:
+                if b'No matching data found' in response.content:
                     raise NoMatchingDataError
             return response
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _datetime_to_str(dtm: pd.Timestamp) -> str:
         """
         Convert a datetime object to a string in UTC
         of the form YYYYMMDDhh00
 
+        The result is cached: block-splitting decorators hit this with the
+        same boundary timestamps over and over (end of year N is the start
+        of year N+1).
+
         Parameters
         ----------
         dtm : pd.Timestamp
@@ -149,37 +243,68 @@ class EntsoeRawClient:
         -------
         str
         """
-        if dtm.tzinfo is not None and dtm.tzinfo != pytz.UTC:
+        # comparing the name instead of the tzinfo object recognizes any
+        # UTC implementation (pytz, datetime.timezone.utc, zoneinfo) and
+        # skips a needless tz_convert for timestamps that are already UTC
+        if dtm.tzinfo is not None and str(dtm.tz) != 'UTC':
             dtm = dtm.tz_convert("UTC")
-        fmt = '%Y%m%d%H00'
-        ret_str = dtm.round(freq='h').strftime(fmt)
-        return ret_str
+        dtm = dtm.round(freq='h')
+        return f'{dtm.year:04d}{dtm.month:02d}{dtm.day:02d}{dtm.hour:02d}00'
 
-    def query_day_ahead_prices(self, country_code: Union[Area, str],
-                               start: pd.Timestamp, end: pd.Timestamp) -> str:
+    def _area_request(self, country_code: Union[Area, str],
+                      start: pd.Timestamp, end: pd.Timestamp, params: Dict,
+                      domain_keys=('in_Domain',),
+                      psr_type: Optional[str] = None) -> bytes:
         """
+        Shared implementation of the single-area query methods: resolve the
+        area, fill in the domain parameters and perform the base request.
+
         Parameters
         ----------
         country_code : Area|str
         start : pd.Timestamp
         end : pd.Timestamp
+        params : dict
+            document specific parameters, copied before use
+        domain_keys : tuple of str
+            parameter names that carry the area code
+        psr_type : str
+            filter on a single psr type
 
         Returns
         -------
-        str
+        bytes
         """
         area = lookup_area(country_code)
-        params = {
-            'documentType': 'A44',
-            'in_Domain': area.code,
-            'out_Domain': area.code
-        }
+        params = dict(params)
+        for key in domain_keys:
+            params[key] = area.code
+        if psr_type:
+            params['psrType'] = psr_type
         response = self._base_request(params=params, start=start, end=end)
-        return response.text
+        return response.content
+
+    def query_day_ahead_prices(self, country_code: Union[Area, str],
+                               start: pd.Timestamp, end: pd.Timestamp) -> bytes:
+        """
+        Parameters
+        ----------
+        country_code : Area|str
+        start : pd.Timestamp
+        end : pd.Timestamp
+
+        Returns
+        -------
+        bytes
+        """
+        return self._area_request(
+            country_code, start=start, end=end,
+            params=_PARAMS_DAY_AHEAD_PRICES,
+            domain_keys=('in_Domain', 'out_Domain'))
 
     def query_aggregated_bids(self, country_code: Union[Area, str],
                               process_type: str,
-                               start: pd.Timestamp, end: pd.Timestamp) -> str:
+                               start: pd.Timestamp, end: pd.Timestamp) -> bytes:
         """
         Parameters
         ----------
@@ -191,21 +316,17 @@ class EntsoeRawClient:
             
         Returns
         -------
-        str
+        bytes
         """
         if process_type not in ['A51', 'A47']:
             raise ValueError('processType allowed values: A51, A47')
-        area = lookup_area(country_code)
-        params = {
-            'documentType': 'A24',
-            'area_Domain': area.code,
-            'processType': process_type
-        }
-        response = self._base_request(params=params, start=start, end=end)
-        return response.text
+        return self._area_request(
+            country_code, start=start, end=end,
+            params={'documentType': 'A24', 'processType': process_type},
+            domain_keys=('area_Domain',))
 
     def query_net_position(self, country_code: Union[Area, str],
-                           start: pd.Timestamp, end: pd.Timestamp, dayahead: bool = True) -> str:
+                           start: pd.Timestamp, end: pd.Timestamp, dayahead: bool = True) -> bytes:
         """
         Parameters
         ----------
@@ -216,24 +337,22 @@ class EntsoeRawClient:
 
         Returns
         -------
-        str
+        bytes
         """
-        area = lookup_area(country_code)
         params = {
             'documentType': 'A25',  # Allocation result document
             'businessType': 'B09',  # net position
             'Contract_MarketAgreement.Type': 'A01',  # daily
-            'in_Domain': area.code,
-            'out_Domain': area.code
         }
         if not dayahead:
             params.update({'Contract_MarketAgreement.Type': "A07"})
 
-        response = self._base_request(params=params, start=start, end=end)
-        return response.text
+        return self._area_request(
+            country_code, start=start, end=end, params=params,
+            domain_keys=('in_Domain', 'out_Domain'))
 
     def query_load(self, country_code: Union[Area, str], start: pd.Timestamp,
-                   end: pd.Timestamp) -> str:
+                   end: pd.Timestamp) -> bytes:
         """
         Parameters
     
@@ -244,21 +363,16 @@ class EntsoeRawClient:
 
         Returns
         -------
-        str
+        bytes
         """
-        area = lookup_area(country_code)
-        params = {
-            'documentType': 'A65',
-            'processType': 'A16',
-            'outBiddingZone_Domain': area.code,
-            'out_Domain': area.code
-        }
-        response = self._base_request(params=params, start=start, end=end)
-        return response.text
+        return self._area_request(
+            country_code, start=start, end=end,
+            params=_PARAMS_LOAD,
+            domain_keys=('outBiddingZone_Domain', 'out_Domain'))
 
     def query_load_forecast(
             self, country_code: Union[Area, str], start: pd.Timestamp,
-            end: pd.Timestamp, process_type: str = 'A01') -> str:
+            end: pd.Timestamp, process_type: str = 'A01') -> bytes:
         """
         Parameters
         ----------
@@ -269,21 +383,16 @@ class EntsoeRawClient:
 
         Returns
         -------
-        str
+        bytes
         """
-        area = lookup_area(country_code)
-        params = {
-            'documentType': 'A65',
-            'processType': process_type,
-            'outBiddingZone_Domain': area.code,
-            # 'out_Domain': domain
-        }
-        response = self._base_request(params=params, start=start, end=end)
-        return response.text
+        return self._area_request(
+            country_code, start=start, end=end,
+            params={'documentType': 'A65', 'processType': process_type},
+            domain_keys=('outBiddingZone_Domain',))
 
     def query_generation_forecast(
             self, country_code: Union[Area, str], start: pd.Timestamp,
-            end: pd.Timestamp, process_type: str = 'A01') -> str:
+            end: pd.Timestamp, process_type: str = 'A01') -> bytes:
         """
         Parameters
         ----------
@@ -294,21 +403,16 @@ class EntsoeRawClient:
 
         Returns
         -------
-        str
+        bytes
         """
-        area = lookup_area(country_code)
-        params = {
-            'documentType': 'A71',
-            'processType': process_type,
-            'in_Domain': area.code,
-        }
-        response = self._base_request(params=params, start=start, end=end)
-        return response.text
+        return self._area_request(
+            country_code, start=start, end=end,
+            params={'documentType': 'A71', 'processType': process_type})
 
     def query_wind_and_solar_forecast(
             self, country_code: Union[Area, str], start: pd.Timestamp,
             end: pd.Timestamp, psr_type: Optional[str] = None,
-            process_type: str = 'A01', **kwargs) -> str:
+            process_type: str = 'A01', **kwargs) -> bytes:
         """
         Parameters
         ----------
@@ -321,21 +425,15 @@ class EntsoeRawClient:
 
         Returns
         -------
-        str
+        bytes
         """
-        area = lookup_area(country_code)
-        params = {
-            'documentType': 'A69',
-            'processType': process_type,
-            'in_Domain': area.code,
-        }
-        if psr_type:
-            params.update({'psrType': psr_type})
-        response = self._base_request(params=params, start=start, end=end)
-        return response.text
+        return self._area_request(
+            country_code, start=start, end=end,
+            params={'documentType': 'A69', 'processType': process_type},
+            psr_type=psr_type)
 
     def query_intraday_wind_and_solar_forecast(
-            self, country_code: Union[Area, str], start: pd.Timestamp, end: pd.Timestamp, psr_type: Optional[str] = None) -> str:
+            self, country_code: Union[Area, str], start: pd.Timestamp, end: pd.Timestamp, psr_type: Optional[str] = None) -> bytes:
         return self.query_wind_and_solar_forecast(country_code=country_code,
                                                   start=start,
                                                   end=end,
@@ -344,7 +442,7 @@ class EntsoeRawClient:
 
     def query_generation(
             self, country_code: Union[Area, str], start: pd.Timestamp,
-            end: pd.Timestamp, psr_type: Optional[str] = None, **kwargs) -> str:
+            end: pd.Timestamp, psr_type: Optional[str] = None, **kwargs) -> bytes:
         """
         Parameters
         ----------
@@ -356,22 +454,16 @@ class EntsoeRawClient:
 
         Returns
         -------
-        str
+        bytes
         """
-        area = lookup_area(country_code)
-        params = {
-            'documentType': 'A75',
-            'processType': 'A16',
-            'in_Domain': area.code,
-        }
-        if psr_type:
-            params.update({'psrType': psr_type})
-        response = self._base_request(params=params, start=start, end=end)
-        return response.text
+        return self._area_request(
+            country_code, start=start, end=end,
+            params=_PARAMS_GENERATION,
+            psr_type=psr_type)
 
     def query_generation_per_plant(
             self, country_code: Union[Area, str], start: pd.Timestamp,
-            end: pd.Timestamp, psr_type: Optional[str] = None, **kwargs) -> str:
+            end: pd.Timestamp, psr_type: Optional[str] = None, **kwargs) -> bytes:
         """
         Parameters
         ----------
@@ -383,22 +475,16 @@ class EntsoeRawClient:
 
         Returns
         -------
-        str
+        bytes
         """
-        area = lookup_area(country_code)
-        params = {
-            'documentType': 'A73',
-            'processType': 'A16',
-            'in_Domain': area.code,
-        }
-        if psr_type:
-            params.update({'psrType': psr_type})
-        response = self._base_request(params=params, start=start, end=end)
-        return response.text
+        return self._area_request(
+            country_code, start=start, end=end,
+            params=_PARAMS_GENERATION_PER_PLANT,
+            psr_type=psr_type)
 
     def query_installed_generation_capacity(
             self, country_code: Union[Area, str], start: pd.Timestamp,
-            end: pd.Timestamp, psr_type: Optional[str] = None) -> str:
+            end: pd.Timestamp, psr_type: Optional[str] = None) -> bytes:
         """
         Parameters
         ----------
@@ -410,22 +496,16 @@ class EntsoeRawClient:
 
         Returns
         -------
-        str
+        bytes
         """
-        area = lookup_area(country_code)
-        params = {
-            'documentType': 'A68',
-            'processType': 'A33',
-            'in_Domain': area.code,
-        }
-        if psr_type:
-            params.update({'psrType': psr_type})
-        response = self._base_request(params=params, start=start, end=end)
-        return response.text
+        return self._area_request(
+            country_code, start=start, end=end,
+            params=_PARAMS_INSTALLED_CAPACITY,
+            psr_type=psr_type)
 
     def query_installed_generation_capacity_per_unit(
             self, country_code: Union[Area, str], start: pd.Timestamp,
-            end: pd.Timestamp, psr_type: Optional[str] = None) -> str:
+            end: pd.Timestamp, psr_type: Optional[str] = None) -> bytes:
         """
         Parameters
         ----------
@@ -437,21 +517,15 @@ class EntsoeRawClient:
 
         Returns
         -------
-        str
+        bytes
         """
-        area = lookup_area(country_code)
-        params = {
-            'documentType': 'A71',
-            'processType': 'A33',
-            'in_Domain': area.code,
-        }
-        if psr_type:
-            params.update({'psrType': psr_type})
-        response = self._base_request(params=params, start=start, end=end)
-        return response.text
+        return self._area_request(
+            country_code, start=start, end=end,
+            params=_PARAMS_INSTALLED_CAPACITY_PER_UNIT,
+            psr_type=psr_type)
 
     def query_aggregate_water_reservoirs_and_hydro_storage(self, country_code: Union[Area, str], start: pd.Timestamp,
-            end: pd.Timestamp) -> str:
+            end: pd.Timestamp) -> bytes:
         """
         Parameters
         ----------
@@ -463,21 +537,16 @@ class EntsoeRawClient:
 
         Returns
         -------
-        str
+        bytes
         """
-        area = lookup_area(country_code)
-        params = {
-            'documentType': 'A72',
-            'processType': 'A16',
-            'in_Domain': area.code
-        }
-        response = self._base_request(params=params, start=start, end=end)
-        return response.text
+        return self._area_request(
+            country_code, start=start, end=end,
+            params=_PARAMS_WATER_RESERVOIRS)
 
     def query_crossborder_flows(
             self, country_code_from: Union[Area, str],
             country_code_to: Union[Area, str], start: pd.Timestamp,
-            end: pd.Timestamp, **kwargs) -> str:
+            end: pd.Timestamp, **kwargs) -> bytes:
         """
         Parameters
         ----------
@@ -488,7 +557,7 @@ class EntsoeRawClient:
 
         Returns
         -------
-        str
+        bytes
         """
         return self._query_crossborder(
             country_code_from=country_code_from,
@@ -501,7 +570,7 @@ class EntsoeRawClient:
             start: pd.Timestamp,
             end: pd.Timestamp,
             dayahead: bool = False,
-            **kwargs) -> str:
+            **kwargs) -> bytes:
         """
         Parameters
         ----------
@@ -513,7 +582,7 @@ class EntsoeRawClient:
 
         Returns
         -------
-        str
+        bytes
         """
         if dayahead:
             contract_marketagreement_type = "A01"
@@ -527,7 +596,7 @@ class EntsoeRawClient:
     def query_net_transfer_capacity_dayahead(
             self, country_code_from: Union[Area, str],
             country_code_to: Union[Area, str], start: pd.Timestamp,
-            end: pd.Timestamp) -> str:
+            end: pd.Timestamp) -> bytes:
         """
         Parameters
         ----------
@@ -538,7 +607,7 @@ class EntsoeRawClient:
 
         Returns
         -------
-        str
+        bytes
         """
         return self._query_crossborder(
             country_code_from=country_code_from,
@@ -548,7 +617,7 @@ class EntsoeRawClient:
     def query_net_transfer_capacity_weekahead(
             self, country_code_from: Union[Area, str],
             country_code_to: Union[Area, str], start: pd.Timestamp,
-            end: pd.Timestamp) -> str:
+            end: pd.Timestamp) -> bytes:
         """
         Parameters
         ----------
@@ -559,7 +628,7 @@ class EntsoeRawClient:
 
         Returns
         -------
-        str
+        bytes
         """
         return self._query_crossborder(
             country_code_from=country_code_from,
@@ -569,7 +638,7 @@ class EntsoeRawClient:
     def query_net_transfer_capacity_monthahead(
             self, country_code_from: Union[Area, str],
             country_code_to: Union[Area, str], start: pd.Timestamp,
-            end: pd.Timestamp) -> str:
+            end: pd.Timestamp) -> bytes:
         """
         Parameters
         ----------
@@ -580,7 +649,7 @@ class EntsoeRawClient:
 
         Returns
         -------
-        str
+        bytes
         """
         return self._query_crossborder(
             country_code_from=country_code_from,
@@ -590,7 +659,7 @@ class EntsoeRawClient:
     def query_net_transfer_capacity_yearahead(
             self, country_code_from: Union[Area, str],
             country_code_to: Union[Area, str], start: pd.Timestamp,
-            end: pd.Timestamp) -> str:
+            end: pd.Timestamp) -> bytes:
         """
         Parameters
         ----------
@@ -601,7 +670,7 @@ class EntsoeRawClient:
 
         Returns
         -------
-        str
+        bytes
         """
         return self._query_crossborder(
             country_code_from=country_code_from,
@@ -611,7 +680,7 @@ class EntsoeRawClient:
     def query_intraday_offered_capacity(
         self, country_code_from: Union[Area, str],
             country_code_to: Union[Area, str], start: pd.Timestamp,
-            end: pd.Timestamp, implicit:bool = True,**kwargs) -> str:
+            end: pd.Timestamp, implicit:bool = True,**kwargs) -> bytes:
         """
         Parameters
         ----------
@@ -623,7 +692,7 @@ class EntsoeRawClient:
 
         Returns
         -------
-        str
+        bytes
         """
         return self._query_crossborder(
             country_code_from=country_code_from,
@@ -635,7 +704,7 @@ class EntsoeRawClient:
         self, country_code_from: Union[Area, str],
             country_code_to: Union[Area, str], start: pd.Timestamp,
             end: pd.Timestamp, contract_marketagreement_type: str,
-            implicit:bool = True,**kwargs) -> str:
+            implicit:bool = True,**kwargs) -> bytes:
         """
         Allocated result documents, for OC evolution see query_intraday_offered_capacity
 
@@ -651,7 +720,7 @@ class EntsoeRawClient:
 
         Returns
         -------
-        str
+        bytes
         """
         if implicit:
             business_type = None
@@ -670,7 +739,7 @@ class EntsoeRawClient:
             country_code_to: Union[Area, str], start: pd.Timestamp,
             end: pd.Timestamp, doctype: str,
             contract_marketagreement_type: Optional[str] = None,
-            auction_type: Optional[str] = None, business_type: Optional[str] = None) -> str:
+            auction_type: Optional[str] = None, business_type: Optional[str] = None) -> bytes:
         """
         Generic function called by query_crossborder_flows,
         query_scheduled_exchanges, query_net_transfer_capacity_DA/WA/MA/YA and query_.
@@ -687,7 +756,7 @@ class EntsoeRawClient:
 
         Returns
         -------
-        str
+        bytes
         """
         area_in = lookup_area(country_code_to)
         area_out = lookup_area(country_code_from)
@@ -708,7 +777,7 @@ class EntsoeRawClient:
                 'businessType'] = business_type
 
         response = self._base_request(params=params, start=start, end=end)
-        return response.text
+        return response.content
 
     def query_activated_balancing_energy_prices(
             self, country_code: Union[Area, str], start: pd.Timestamp,
@@ -738,23 +807,19 @@ class EntsoeRawClient:
         -------
         bytes
         """
-        area = lookup_area(country_code)
         params = {
             'documentType': 'A84',
             'processType': process_type,
-            'controlArea_Domain': area.code,
         }
-        if psr_type:
-            params.update({'psrType': psr_type})
         if business_type:
             params.update({'businessType': business_type})
         if standard_market_product:
             params.update({'standardMarketProduct': standard_market_product})
         if original_market_product:
             params.update({'originalMarketProduct': original_market_product})
-        response = self._base_request(params=params, start=start, end=end)
-        
-        return response.content
+        return self._area_request(
+            country_code, start=start, end=end, params=params,
+            domain_keys=('controlArea_Domain',), psr_type=psr_type)
     
     def query_imbalance_prices(
             self, country_code: Union[Area, str], start: pd.Timestamp,
@@ -772,15 +837,10 @@ class EntsoeRawClient:
         -------
         bytes
         """
-        area = lookup_area(country_code)
-        params = {
-            'documentType': 'A85',
-            'controlArea_Domain': area.code,
-        }
-        if psr_type:
-            params.update({'psrType': psr_type})
-        response = self._base_request(params=params, start=start, end=end)
-        return response.content
+        return self._area_request(
+            country_code, start=start, end=end,
+            params=_PARAMS_IMBALANCE_PRICES,
+            domain_keys=('controlArea_Domain',), psr_type=psr_type)
 
     def query_imbalance_volumes(
             self, country_code: Union[Area, str], start: pd.Timestamp,
@@ -798,15 +858,10 @@ class EntsoeRawClient:
         -------
         bytes
         """
-        area = lookup_area(country_code)
-        params = {
-            'documentType': 'A86',
-            'controlArea_Domain': area.code,
-        }
-        if psr_type:
-            params.update({'psrType': psr_type})
-        response = self._base_request(params=params, start=start, end=end)
-        return response.content
+        return self._area_request(
+            country_code, start=start, end=end,
+            params=_PARAMS_IMBALANCE_VOLUMES,
+            domain_keys=('controlArea_Domain',), psr_type=psr_type)
 
     def query_procured_balancing_capacity(
             self, country_code: Union[Area, str], start: pd.Timestamp,
@@ -830,16 +885,15 @@ class EntsoeRawClient:
         if process_type not in ['A51', 'A47']:
             raise ValueError('processType allowed values: A51, A47')
 
-        area = lookup_area(country_code)
         params = {
             'documentType': 'A15',
-            'area_Domain': area.code,
             'processType': process_type
         }
         if type_marketagreement_type:
             params.update({'type_MarketAgreement.Type': type_marketagreement_type})
-        response = self._base_request(params=params, start=start, end=end)
-        return response.content
+        return self._area_request(
+            country_code, start=start, end=end, params=params,
+            domain_keys=('area_Domain',))
 
     def query_activated_balancing_energy(
             self, country_code: Union[Area, str], start: pd.Timestamp,
@@ -861,22 +915,16 @@ class EntsoeRawClient:
         -------
         bytes
         """
-        area = lookup_area(country_code)
-        params = {
-            'documentType': 'A83',
-            'controlArea_Domain': area.code,
-            'businessType': business_type
-        }
-        if psr_type:
-            params.update({'psrType': psr_type})
-        response = self._base_request(params=params, start=start, end=end)
-        return response.content
+        return self._area_request(
+            country_code, start=start, end=end,
+            params={'documentType': 'A83', 'businessType': business_type},
+            domain_keys=('controlArea_Domain',), psr_type=psr_type)
 
     def query_contracted_reserve_prices(
             self, country_code: Union[Area, str], start: pd.Timestamp,
             end: pd.Timestamp, type_marketagreement_type: str,
             psr_type: Optional[str] = None,
-            offset: int = 0) -> str:
+            offset: int = 0) -> bytes:
         """
         Parameters
         ----------
@@ -892,25 +940,22 @@ class EntsoeRawClient:
 
         Returns
         -------
-        str
+        bytes
         """
-        area = lookup_area(country_code)
-        params = {
-            'documentType': 'A89',
-            'controlArea_Domain': area.code,
-            'type_MarketAgreement.Type': type_marketagreement_type,
-            'offset': offset
-        }
-        if psr_type:
-            params.update({'psrType': psr_type})
-        response = self._base_request(params=params, start=start, end=end)
-        return response.text
+        return self._area_request(
+            country_code, start=start, end=end,
+            params={
+                'documentType': 'A89',
+                'type_MarketAgreement.Type': type_marketagreement_type,
+                'offset': offset
+            },
+            domain_keys=('controlArea_Domain',), psr_type=psr_type)
 
     def query_contracted_reserve_amount(
             self, country_code: Union[Area, str], start: pd.Timestamp,
             end: pd.Timestamp, type_marketagreement_type: str,
             psr_type: Optional[str] = None,
-            offset: int = 0) -> str:
+            offset: int = 0) -> bytes:
         """
         Parameters
         ----------
@@ -926,19 +971,16 @@ class EntsoeRawClient:
 
         Returns
         -------
-        str
+        bytes
         """
-        area = lookup_area(country_code)
-        params = {
-            'documentType': 'A81',
-            'controlArea_Domain': area.code,
-            'type_MarketAgreement.Type': type_marketagreement_type,
-            'offset': offset
-        }
-        if psr_type:
-            params.update({'psrType': psr_type})
-        response = self._base_request(params=params, start=start, end=end)
-        return response.text
+        return self._area_request(
+            country_code, start=start, end=end,
+            params={
+                'documentType': 'A81',
+                'type_MarketAgreement.Type': type_marketagreement_type,
+                'offset': offset
+            },
+            domain_keys=('controlArea_Domain',), psr_type=psr_type)
 
     def _query_unavailability(
             self, country_code: Union[Area, str], start: pd.Timestamp,
@@ -966,10 +1008,8 @@ class EntsoeRawClient:
         -------
         bytes
         """
-        area = lookup_area(country_code)
         params = {
             'documentType': doctype,
-            'biddingZone_domain': area.code,
             'offset': offset
             # ,'businessType': 'A53 (unplanned) | A54 (planned)'
         }
@@ -979,8 +1019,9 @@ class EntsoeRawClient:
             params['periodStartUpdate'] = self._datetime_to_str(
                 periodstartupdate)
             params['periodEndUpdate'] = self._datetime_to_str(periodendupdate)
-        response = self._base_request(params=params, start=start, end=end)
-        return response.content
+        return self._area_request(
+            country_code, start=start, end=end, params=params,
+            domain_keys=('biddingZone_domain',))
 
     def query_unavailability_of_generation_units(
             self, country_code: Union[Area, str], start: pd.Timestamp,
@@ -1106,6 +1147,102 @@ class EntsoeRawClient:
         return content
 
 class EntsoePandasClient(EntsoeRawClient):
+    def __init__(self, *args, cache_ttl: Optional[int] = None, **kwargs):
+        """
+        Parameters
+        ----------
+        cache_ttl : int
+            keep parsed query results in an in-memory cache for this many
+            seconds and serve repeated identical calls from it. Defaults
+            to no caching.
+
+        Remaining arguments are passed through to EntsoeRawClient.
+        """
+        super().__init__(*args, **kwargs)
+        self.cache_ttl = cache_ttl
+        self._query_cache = {}
+        self._cache_lock = threading.Lock()
+        # borders that recently returned no data for a window; always on
+        # since a negative result is cheap to keep and revisited hourly
+        self._noflow_cache = {}
+
+    @staticmethod
+    def _overlap_mask(df, start: pd.Timestamp, end: pd.Timestamp):
+        """
+        Boolean ndarray marking outage rows whose period touches the
+        requested window. The comparisons run directly on the int64
+        nanosecond values behind the datetime columns (normalized to UTC
+        like Timestamp.value), so no Series or tz machinery is involved;
+        the or happens in place on the ndarray.
+        """
+        start_ns = df['start'].to_numpy(dtype='datetime64[ns]').view('i8')
+        end_ns = df['end'].to_numpy(dtype='datetime64[ns]').view('i8')
+        mask = start_ns < end.value
+        np.logical_or(mask, end_ns > start.value, out=mask)
+        return mask
+
+    @staticmethod
+    def _finalize(frame, area, start: pd.Timestamp, end: pd.Timestamp):
+        """
+        Shared epilogue of the query methods: window the frame to
+        [start, end] while the index is still in UTC, then convert it to
+        the local timezone of the area. Truncating first means the tz
+        arithmetic only touches the rows that are kept.
+
+        Parameters
+        ----------
+        frame : pd.Series | pd.DataFrame
+        area : Area
+        start : pd.Timestamp
+        end : pd.Timestamp
+
+        Returns
+        -------
+        pd.Series | pd.DataFrame
+        """
+        if frame.index.is_monotonic_increasing:
+            # a label slice on a sorted DatetimeIndex is a single
+            # searchsorted and skips truncate's axis plumbing; the bounds
+            # are inclusive on both ends, like truncate's
+            frame = frame.loc[start:end]
+        else:
+            frame = frame.truncate(before=start, after=end)
+        if frame.index.tz is not None and str(frame.index.tz) == area.tz:
+            # already in the target timezone (e.g. UTC areas); converting
+            # would just rebuild an identical index
+            return frame
+        return frame.tz_convert(_pytz_timezone(area.tz))
+
+    def _query_crossborder_series(
+            self, raw_method, country_code_from: Union[Area, str],
+            country_code_to: Union[Area, str], start: pd.Timestamp,
+            end: pd.Timestamp, **kwargs) -> pd.Series:
+        """
+        Shared implementation of the crossborder query methods: resolve
+        both areas, fetch the raw document through raw_method, parse the
+        flows and window the result in the origin country's timezone.
+
+        Parameters
+        ----------
+        raw_method : callable
+            bound raw-client method that returns the document bytes
+        country_code_from : Area|str
+        country_code_to : Area|str
+        start : pd.Timestamp
+        end : pd.Timestamp
+
+        Returns
+        -------
+        pd.Series
+        """
+        area_to = lookup_area(country_code_to)
+        area_from = lookup_area(country_code_from)
+        text = raw_method(
+            country_code_from=area_from, country_code_to=area_to,
+            start=start, end=end, **kwargs)
+        ts = parse_crossborder_flows(text)
+        return self._finalize(ts, area_from, start, end)
+
     @year_limited
     def query_net_position(self, country_code: Union[Area, str],
                             start: pd.Timestamp, end: pd.Timestamp, dayahead: bool = True) -> pd.Series:
@@ -1122,12 +1259,10 @@ class EntsoePandasClient(EntsoeRawClient):
 
         """
         area = lookup_area(country_code)
-        text = super(EntsoePandasClient, self).query_net_position(
+        text = super().query_net_position(
             country_code=area, start=start, end=end, dayahead=dayahead)
         series = parse_netpositions(text)
-        series = series.tz_convert(area.tz)
-        series = series.truncate(before=start, after=end)
-        return series
+        return self._finalize(series, area, start, end)
 
     @year_limited
     def query_aggregated_bids(self, country_code: Union[Area, str],
@@ -1147,13 +1282,12 @@ class EntsoePandasClient(EntsoeRawClient):
         pd.DataFrame
         """
         area = lookup_area(country_code)
-        text = super(EntsoePandasClient, self).query_aggregated_bids(
+        text = super().query_aggregated_bids(
             country_code=area, process_type=process_type, start=start, end=end)
         df = parse_aggregated_bids(text)
-        df = df.tz_convert(area.tz)
-        df = df.truncate(before=start, after=end)
-        return df
+        return self._finalize(df, area, start, end)
     
+    @cached_query
     @year_limited
     def query_day_ahead_prices(
             self, country_code: Union[Area, str],
@@ -1177,7 +1311,7 @@ class EntsoePandasClient(EntsoeRawClient):
             raise InvalidParameterError('Please choose either 60min, 30min or 15min')
         area = lookup_area(country_code)
         # we do here extra days at start and end to fix issue 187
-        text = super(EntsoePandasClient, self).query_day_ahead_prices(
+        text = super().query_day_ahead_prices(
             country_code=area,
             start=start-pd.Timedelta(days=1),
             end=end+pd.Timedelta(days=1)
@@ -1185,13 +1319,13 @@ class EntsoePandasClient(EntsoeRawClient):
         series = parse_prices(text)[resolution]
         if len(series) == 0:
             raise NoMatchingDataError
-        series = series.tz_convert(area.tz)
-        series = series.truncate(before=start, after=end)
+        series = self._finalize(series, area, start, end)
         # because of the above fix we need to check again if any valid data exists after truncating
         if len(series) == 0:
             raise NoMatchingDataError
         return series
 
+    @cached_query
     @year_limited
     def query_load(self, country_code: Union[Area, str], start: pd.Timestamp,
                    end: pd.Timestamp) -> pd.DataFrame:
@@ -1207,14 +1341,13 @@ class EntsoePandasClient(EntsoeRawClient):
         pd.DataFrame
         """
         area = lookup_area(country_code)
-        text = super(EntsoePandasClient, self).query_load(
+        text = super().query_load(
             country_code=area, start=start, end=end)
 
         df = parse_loads(text, process_type='A16')
-        df = df.tz_convert(area.tz)
-        df = df.truncate(before=start, after=end)
-        return df
+        return self._finalize(df, area, start, end)
 
+    @cached_query
     @year_limited
     def query_load_forecast(
             self, country_code: Union[Area, str], start: pd.Timestamp,
@@ -1232,13 +1365,11 @@ class EntsoePandasClient(EntsoeRawClient):
         pd.DataFrame
         """
         area = lookup_area(country_code)
-        text = super(EntsoePandasClient, self).query_load_forecast(
+        text = super().query_load_forecast(
             country_code=area, start=start, end=end, process_type=process_type)
 
         df = parse_loads(text, process_type=process_type)
-        df = df.tz_convert(area.tz)
-        df = df.truncate(before=start, after=end)
-        return df
+        return self._finalize(df, area, start, end)
 
     def query_load_and_forecast(
             self, country_code: Union[Area, str], start: pd.Timestamp,
@@ -1257,11 +1388,19 @@ class EntsoePandasClient(EntsoeRawClient):
         -------
         pd.DataFrame
         """
-        df_load_forecast_da = self.query_load_forecast(country_code, start=start, end=end)
-        df_load = self.query_load(country_code, start=start, end=end)
+        # the two sub-queries are independent, issue them side by side on
+        # the pooled session instead of paying for both round-trips in turn
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            future_forecast = executor.submit(
+                self.query_load_forecast, country_code, start=start, end=end)
+            future_load = executor.submit(
+                self.query_load, country_code, start=start, end=end)
+            df_load_forecast_da = future_forecast.result()
+            df_load = future_load.result()
         return df_load_forecast_da.join(df_load, sort=True, how='outer')
 
 
+    @cached_query
     @year_limited
     def query_generation_forecast(
             self, country_code: Union[Area, str], start: pd.Timestamp,
@@ -1282,13 +1421,12 @@ class EntsoePandasClient(EntsoeRawClient):
         pd.DataFrame | pd.Series
         """
         area = lookup_area(country_code)
-        text = super(EntsoePandasClient, self).query_generation_forecast(
+        text = super().query_generation_forecast(
             country_code=area, start=start, end=end, process_type=process_type)
         df = parse_generation(text, nett=nett)
-        df = df.tz_convert(area.tz)
-        df = df.truncate(before=start, after=end)
-        return df
+        return self._finalize(df, area, start, end)
 
+    @cached_query
     @year_limited
     def query_wind_and_solar_forecast(
             self, country_code: Union[Area, str], start: pd.Timestamp,
@@ -1309,13 +1447,11 @@ class EntsoePandasClient(EntsoeRawClient):
         pd.DataFrame
         """
         area = lookup_area(country_code)
-        text = super(EntsoePandasClient, self).query_wind_and_solar_forecast(
+        text = super().query_wind_and_solar_forecast(
             country_code=area, start=start, end=end, psr_type=psr_type,
             process_type=process_type)
         df = parse_generation(text, nett=True)
-        df = df.tz_convert(area.tz)
-        df = df.truncate(before=start, after=end)
-        return df
+        return self._finalize(df, area, start, end)
 
     def query_intraday_wind_and_solar_forecast(
             self, country_code: Union[Area, str], start: pd.Timestamp,
@@ -1327,6 +1463,7 @@ class EntsoePandasClient(EntsoeRawClient):
                                                   process_type='A40')
 
 
+    @cached_query
     @year_limited
     def query_generation(
             self, country_code: Union[Area, str], start: pd.Timestamp,
@@ -1348,12 +1485,10 @@ class EntsoePandasClient(EntsoeRawClient):
         pd.DataFrame
         """
         area = lookup_area(country_code)
-        text = super(EntsoePandasClient, self).query_generation(
+        text = super().query_generation(
             country_code=area, start=start, end=end, psr_type=psr_type)
         df = parse_generation(text, nett=nett)
-        df = df.tz_convert(area.tz)
-        df = df.truncate(before=start, after=end)
-        return df
+        return self._finalize(df, area, start, end)
 
     @year_limited
     def query_installed_generation_capacity(
@@ -1374,11 +1509,10 @@ class EntsoePandasClient(EntsoeRawClient):
         """
         
         area = lookup_area(country_code)
-        text = super(
-            EntsoePandasClient, self).query_installed_generation_capacity(
+        text = super().query_installed_generation_capacity(
             country_code=area, start=start, end=end, psr_type=psr_type)
         df = parse_generation(text)
-        df = df.tz_convert(area.tz)
+        df = df.tz_convert(_pytz_timezone(area.tz))
         # Truncate to YearBegin and YearEnd, because answer is always year-based
         df = df.truncate(before=start - YearBegin(), after=end + YearEnd())
         return df
@@ -1401,9 +1535,7 @@ class EntsoePandasClient(EntsoeRawClient):
         pd.DataFrame
         """
         area = lookup_area(country_code)
-        text = super(
-            EntsoePandasClient,
-            self).query_installed_generation_capacity_per_unit(
+        text = super().query_installed_generation_capacity_per_unit(
             country_code=area, start=start, end=end, psr_type=psr_type)
         df = parse_installed_capacity_per_plant(text)
         return df
@@ -1413,9 +1545,7 @@ class EntsoePandasClient(EntsoeRawClient):
     def query_aggregate_water_reservoirs_and_hydro_storage(self, country_code: Union[Area, str], start: pd.Timestamp,
             end: pd.Timestamp) -> pd.DataFrame:
         area = lookup_area(country_code)
-        text = super(
-            EntsoePandasClient,
-            self).query_aggregate_water_reservoirs_and_hydro_storage(
+        text = super().query_aggregate_water_reservoirs_and_hydro_storage(
             country_code=area, start=start, end=end)
 
         df = parse_water_hydro(text)
@@ -1423,6 +1553,7 @@ class EntsoePandasClient(EntsoeRawClient):
         return df
 
 
+    @cached_query
     @year_limited
     def query_crossborder_flows(
             self, country_code_from: Union[Area, str],
@@ -1442,17 +1573,9 @@ class EntsoePandasClient(EntsoeRawClient):
         -------
         pd.Series
         """
-        area_to = lookup_area(country_code_to)
-        area_from = lookup_area(country_code_from)
-        text = super(EntsoePandasClient, self).query_crossborder_flows(
-            country_code_from=area_from,
-            country_code_to=area_to,
-            start=start,
-            end=end)
-        ts = parse_crossborder_flows(text)
-        ts = ts.tz_convert(area_from.tz)
-        ts = ts.truncate(before=start, after=end)
-        return ts
+        return self._query_crossborder_series(
+            super().query_crossborder_flows,
+            country_code_from, country_code_to, start, end)
 
     @year_limited
     def query_scheduled_exchanges(
@@ -1477,18 +1600,10 @@ class EntsoePandasClient(EntsoeRawClient):
         -------
         pd.Series
         """
-        area_to = lookup_area(country_code_to)
-        area_from = lookup_area(country_code_from)
-        text = super(EntsoePandasClient, self).query_scheduled_exchanges(
-            country_code_from=area_from,
-            country_code_to=area_to,
-            dayahead=dayahead,
-            start=start,
-            end=end)
-        ts = parse_crossborder_flows(text)
-        ts = ts.tz_convert(area_from.tz)
-        ts = ts.truncate(before=start, after=end)
-        return ts
+        return self._query_crossborder_series(
+            super().query_scheduled_exchanges,
+            country_code_from, country_code_to, start, end,
+            dayahead=dayahead)
 
     @year_limited
     def query_net_transfer_capacity_dayahead(
@@ -1509,17 +1624,9 @@ class EntsoePandasClient(EntsoeRawClient):
         -------
         pd.Series
         """
-        area_to = lookup_area(country_code_to)
-        area_from = lookup_area(country_code_from)
-        text = super(EntsoePandasClient, self).query_net_transfer_capacity_dayahead(
-            country_code_from=area_from,
-            country_code_to=area_to,
-            start=start,
-            end=end)
-        ts = parse_crossborder_flows(text)
-        ts = ts.tz_convert(area_from.tz)
-        ts = ts.truncate(before=start, after=end)
-        return ts
+        return self._query_crossborder_series(
+            super().query_net_transfer_capacity_dayahead,
+            country_code_from, country_code_to, start, end)
 
     @year_limited
     def query_net_transfer_capacity_weekahead(
@@ -1540,17 +1647,9 @@ class EntsoePandasClient(EntsoeRawClient):
         -------
         pd.Series
         """
-        area_to = lookup_area(country_code_to)
-        area_from = lookup_area(country_code_from)
-        text = super(EntsoePandasClient, self).query_net_transfer_capacity_weekahead(
-            country_code_from=area_from,
-            country_code_to=area_to,
-            start=start,
-            end=end)
-        ts = parse_crossborder_flows(text)
-        ts = ts.tz_convert(area_from.tz)
-        ts = ts.truncate(before=start, after=end)
-        return ts
+        return self._query_crossborder_series(
+            super().query_net_transfer_capacity_weekahead,
+            country_code_from, country_code_to, start, end)
 
     @year_limited
     def query_net_transfer_capacity_monthahead(
@@ -1571,17 +1670,9 @@ class EntsoePandasClient(EntsoeRawClient):
         -------
         pd.Series
         """
-        area_to = lookup_area(country_code_to)
-        area_from = lookup_area(country_code_from)
-        text = super(EntsoePandasClient, self).query_net_transfer_capacity_monthahead(
-            country_code_from=area_from,
-            country_code_to=area_to,
-            start=start,
-            end=end)
-        ts = parse_crossborder_flows(text)
-        ts = ts.tz_convert(area_from.tz)
-        ts = ts.truncate(before=start, after=end)
-        return ts
+        return self._query_crossborder_series(
+            super().query_net_transfer_capacity_monthahead,
+            country_code_from, country_code_to, start, end)
 
     @year_limited
     def query_net_transfer_capacity_yearahead(
@@ -1602,17 +1693,9 @@ class EntsoePandasClient(EntsoeRawClient):
         -------
         pd.Series
         """
-        area_to = lookup_area(country_code_to)
-        area_from = lookup_area(country_code_from)
-        text = super(EntsoePandasClient, self).query_net_transfer_capacity_yearahead(
-            country_code_from=area_from,
-            country_code_to=area_to,
-            start=start,
-            end=end)
-        ts = parse_crossborder_flows(text)
-        ts = ts.tz_convert(area_from.tz)
-        ts = ts.truncate(before=start, after=end)
-        return ts
+        return self._query_crossborder_series(
+            super().query_net_transfer_capacity_yearahead,
+            country_code_from, country_code_to, start, end)
 
     @year_limited
     def query_intraday_offered_capacity(
@@ -1633,18 +1716,10 @@ class EntsoePandasClient(EntsoeRawClient):
         -------
         pd.Series
         """
-        area_to = lookup_area(country_code_to)
-        area_from = lookup_area(country_code_from)
-        text = super(EntsoePandasClient, self).query_intraday_offered_capacity(
-            country_code_from=area_from,
-            country_code_to=area_to,
-            start=start,
-            end=end,
+        return self._query_crossborder_series(
+            super().query_intraday_offered_capacity,
+            country_code_from, country_code_to, start, end,
             implicit=implicit)
-        ts = parse_crossborder_flows(text)
-        ts = ts.tz_convert(area_from.tz)
-        ts = ts.truncate(before=start, after=end)
-        return ts
 
     @year_limited
     @paginated
@@ -1676,20 +1751,12 @@ class EntsoePandasClient(EntsoeRawClient):
         -------
         pd.Series
         """
-        area_to = lookup_area(country_code_to)
-        area_from = lookup_area(country_code_from)
-        text = super(EntsoePandasClient, self).query_offered_capacity(
-            country_code_from=area_from,
-            country_code_to=area_to,
-            start=start,
-            end=end,
+        return self._query_crossborder_series(
+            super().query_offered_capacity,
+            country_code_from, country_code_to, start, end,
             contract_marketagreement_type=contract_marketagreement_type,
             implicit=implicit,
             offset=offset)
-        ts = parse_crossborder_flows(text)
-        ts = ts.tz_convert(area_from.tz)
-        ts = ts.truncate(before=start, after=end)
-        return ts
 
     @year_limited
     def query_activated_balancing_energy_prices(
@@ -1721,7 +1788,7 @@ class EntsoePandasClient(EntsoeRawClient):
         pd.DataFrame
         """
         area = lookup_area(country_code)
-        text = super(EntsoePandasClient, self).query_activated_balancing_energy_prices(
+        text = super().query_activated_balancing_energy_prices(
             country_code=area, start=start, end=end, 
             process_type=process_type,
             psr_type=psr_type,
@@ -1729,9 +1796,7 @@ class EntsoePandasClient(EntsoeRawClient):
             standard_market_product=standard_market_product,
             original_market_product=original_market_product)
         df = parse_activated_balancing_energy_prices(text)
-        df = df.tz_convert(area.tz)
-        df = df.truncate(before=start, after=end)
-        return df
+        return self._finalize(df, area, start, end)
     
     @year_limited
     def query_imbalance_prices(
@@ -1751,12 +1816,10 @@ class EntsoePandasClient(EntsoeRawClient):
         pd.DataFrame
         """
         area = lookup_area(country_code)
-        archive = super(EntsoePandasClient, self).query_imbalance_prices(
+        archive = super().query_imbalance_prices(
             country_code=area, start=start, end=end, psr_type=psr_type)
         df = parse_imbalance_prices_zip(zip_contents=archive)
-        df = df.tz_convert(area.tz)
-        df = df.truncate(before=start, after=end)
-        return df
+        return self._finalize(df, area, start, end)
 
     @year_limited
     def query_imbalance_volumes(
@@ -1776,12 +1839,10 @@ class EntsoePandasClient(EntsoeRawClient):
         pd.DataFrame
         """
         area = lookup_area(country_code)
-        archive = super(EntsoePandasClient, self).query_imbalance_volumes(
+        archive = super().query_imbalance_volumes(
             country_code=area, start=start, end=end, psr_type=psr_type)
         df = parse_imbalance_volumes_zip(zip_contents=archive)
-        df = df.tz_convert(area.tz)
-        df = df.truncate(before=start, after=end)
-        return df
+        return self._finalize(df, area, start, end)
 
     @year_limited
     @paginated
@@ -1808,13 +1869,11 @@ class EntsoePandasClient(EntsoeRawClient):
         pd.DataFrame
         """
         area = lookup_area(country_code)
-        text = super(EntsoePandasClient, self).query_procured_balancing_capacity(
+        text = super().query_procured_balancing_capacity(
             country_code=area, start=start, end=end,
             process_type=process_type, type_marketagreement_type=type_marketagreement_type)
         df = parse_procured_balancing_capacity(text, area.tz)
-        df = df.tz_convert(area.tz)
-        df = df.truncate(before=start, after=end)
-        return df
+        return self._finalize(df, area, start, end)
 
     @year_limited
     def query_activated_balancing_energy(
@@ -1838,13 +1897,11 @@ class EntsoePandasClient(EntsoeRawClient):
         pd.DataFrame
         """
         area = lookup_area(country_code)
-        text = super(EntsoePandasClient, self).query_activated_balancing_energy(
+        text = super().query_activated_balancing_energy(
             country_code=area, start=start, end=end,
             business_type=business_type, psr_type=psr_type)
         df = parse_contracted_reserve(text, area.tz, "quantity")
-        df = df.tz_convert(area.tz)
-        df = df.truncate(before=start, after=end)
-        return df
+        return self._finalize(df, area, start, end)
 
     @year_limited
     @paginated
@@ -1875,14 +1932,12 @@ class EntsoePandasClient(EntsoeRawClient):
         pd.DataFrame
         """
         area = lookup_area(country_code)
-        text = super(EntsoePandasClient, self).query_contracted_reserve_prices(
+        text = super().query_contracted_reserve_prices(
             country_code=area, start=start, end=end,
             type_marketagreement_type=type_marketagreement_type,
             psr_type=psr_type, offset=offset)
         df = parse_contracted_reserve(text, area.tz, "procurement_price.amount")
-        df = df.tz_convert(area.tz)
-        df = df.truncate(before=start, after=end)
-        return df
+        return self._finalize(df, area, start, end)
 
     @year_limited
     @paginated
@@ -1913,14 +1968,12 @@ class EntsoePandasClient(EntsoeRawClient):
         pd.DataFrame
         """
         area = lookup_area(country_code)
-        text = super(EntsoePandasClient, self).query_contracted_reserve_amount(
+        text = super().query_contracted_reserve_amount(
             country_code=area, start=start, end=end,
             type_marketagreement_type=type_marketagreement_type,
             psr_type=psr_type, offset=offset)
         df = parse_contracted_reserve(text, area.tz, "quantity")
-        df = df.tz_convert(area.tz)
-        df = df.truncate(before=start, after=end)
-        return df
+        return self._finalize(df, area, start, end)
 
     @year_limited
     @paginated
@@ -1948,15 +2001,17 @@ class EntsoePandasClient(EntsoeRawClient):
         pd.DataFrame
         """
         area = lookup_area(country_code)
-        content = super(EntsoePandasClient, self)._query_unavailability(
+        content = super()._query_unavailability(
             country_code=area, start=start, end=end, doctype=doctype,
             docstatus=docstatus, periodstartupdate=periodstartupdate,
             periodendupdate=periodendupdate, offset=offset)
         df = parse_unavailabilities(content, doctype)
-        df = df.tz_convert(area.tz)
-        df['start'] = df['start'].apply(lambda x: x.tz_convert(area.tz))
-        df['end'] = df['end'].apply(lambda x: x.tz_convert(area.tz))
-        df = df[(df['start'] < end) | (df['end'] > start)]
+        # filter before the timezone conversions so only the surviving
+        # rows are converted
+        df = df.iloc[np.flatnonzero(self._overlap_mask(df, start, end))]
+        df = df.tz_convert(_pytz_timezone(area.tz))
+        df['start'] = df['start'].dt.tz_convert(_pytz_timezone(area.tz))
+        df['end'] = df['end'].dt.tz_convert(_pytz_timezone(area.tz))
         return df
 
     def query_unavailability_of_generation_units(
@@ -2036,15 +2091,14 @@ class EntsoePandasClient(EntsoeRawClient):
         """
         area_to = lookup_area(country_code_to)
         area_from = lookup_area(country_code_from)
-        content = super(EntsoePandasClient,
-                        self).query_unavailability_transmission(
+        content = super().query_unavailability_transmission(
             area_from, area_to, start, end, docstatus, periodstartupdate,
             periodendupdate, offset=offset)
         df = parse_unavailabilities(content, "A78")
-        df = df.tz_convert(area_from.tz)
-        df['start'] = df['start'].apply(lambda x: x.tz_convert(area_from.tz))
-        df['end'] = df['end'].apply(lambda x: x.tz_convert(area_from.tz))
-        df = df[(df['start'] < end) | (df['end'] > start)]
+        df = df.iloc[np.flatnonzero(self._overlap_mask(df, start, end))]
+        df = df.tz_convert(_pytz_timezone(area_from.tz))
+        df['start'] = df['start'].dt.tz_convert(_pytz_timezone(area_from.tz))
+        df['end'] = df['end'].dt.tz_convert(_pytz_timezone(area_from.tz))
         return df
 
     def query_withdrawn_unavailability_of_generation_units(
@@ -2063,7 +2117,7 @@ class EntsoePandasClient(EntsoeRawClient):
         """
         df = self.query_unavailability_of_generation_units(
             country_code=country_code, start=start, end=end, docstatus='A13')
-        df = df[(df['start'] < end) | (df['end'] > start)]
+        df = df.iloc[np.flatnonzero(self._overlap_mask(df, start, end))]
         return df
 
     @day_limited
@@ -2088,18 +2142,35 @@ class EntsoePandasClient(EntsoeRawClient):
         pd.DataFrame
         """
         area = lookup_area(country_code)
-        text = super(EntsoePandasClient, self).query_generation_per_plant(
+        text = super().query_generation_per_plant(
             country_code=area, start=start, end=end, psr_type=psr_type)
         df = parse_generation(text, per_plant=True, include_eic=include_eic)
-        df.columns = df.columns.set_levels(df.columns.levels[0].str.encode('latin-1').str.decode('utf-8'), level=0)
-        df = df.tz_convert(area.tz)
+        # repair mojibake from historically latin-1-decoded responses,
+        # one attempt per unique level value; names that are already
+        # proper utf-8 fail the round-trip and are kept as-is
+        def _fix_name(name):
+            try:
+                return name.encode('latin-1').decode('utf-8')
+            except (UnicodeEncodeError, UnicodeDecodeError):
+                return name
+
+        lvl0 = df.columns.levels[0]
+        fixed = pd.Index([_fix_name(name) for name in lvl0])
+        # only the level-0 labels change, the codes stay valid, so build
+        # the MultiIndex directly and skip set_levels' validation pass
+        df.columns = pd.MultiIndex(
+            levels=[fixed] + list(df.columns.levels[1:]),
+            codes=list(df.columns.codes),
+            names=df.columns.names,
+            verify_integrity=False)
         # Truncation will fail if data is not sorted along the index in rare
         # cases. Ensure the dataframe is sorted:
-        df = df.sort_index(axis=0)
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index(axis=0)
+        df = self._finalize(df, area, start, end)
 
         if df.columns.nlevels == 2:
             df = df.assign(newlevel='Actual Aggregated').set_index('newlevel', append=True).unstack('newlevel')
-        df = df.truncate(before=start, after=end)
         return df
 
     def query_physical_crossborder_allborders(self, country_code: Union[Area, str], start: pd.Timestamp,
@@ -2108,13 +2179,28 @@ class EntsoePandasClient(EntsoeRawClient):
         Adds together all physical cross-border flows to a country for a given direction
         The neighbours of a country are given by the NEIGHBOURS mapping
 
+        The physical flows document (A11) takes exactly one
+        in_Domain/out_Domain pair per request, so there is no way to ask
+        the API for all borders at once; the per-border requests are
+        issued in parallel instead.
+
         if export is True then all export flows are returned, if False then all import flows are returned
         some borders have more then once data points per hour. Set per_hour=True if you always want hourly data,
         it will then thake the mean
         """
         area = lookup_area(country_code)
-        imports = []
-        for neighbour in NEIGHBOURS[area.name]:
+        neighbours = NEIGHBOURS[area.name]
+
+        def fetch(neighbour):
+            # skip borders that recently came back empty for this window
+            key = (area.name, neighbour, export, start.value, end.value)
+            recorded = self._noflow_cache.get(key)
+            if recorded is not None:
+                if monotonic() - recorded < _NOFLOW_TTL:
+                    return None
+                # concurrent calls may race on the expired entry, so
+                # drop it tolerantly instead of del
+                self._noflow_cache.pop(key, None)
             try:
                 if export:
                     im = self.query_crossborder_flows(country_code_from=country_code,
@@ -2129,14 +2215,44 @@ class EntsoePandasClient(EntsoeRawClient):
                                                       start=start,
                                                       lookup_bzones=True)
             except NoMatchingDataError:
-                continue
+                self._noflow_cache[key] = monotonic()
+                return None
             im.name = neighbour
-            imports.append(im)
-        df = pd.concat(imports, axis=1, sort=True)
-        # drop columns that contain only zero's
-        df = df.loc[:, (df != 0).any(axis=0)]
-        df = df.tz_convert(area.tz)
-        df = df.truncate(before=start, after=end)
+            return im
+
+        # each border is an independent HTTP round-trip, so fan the
+        # neighbours out on a thread pool when the client opted into
+        # concurrency; executor.map keeps the NEIGHBOURS ordering in the
+        # result. Like the block-splitting decorators, the default stays
+        # sequential to respect the API rate limits.
+        max_concurrency = self.max_concurrency
+        if (max_concurrency is not None and max_concurrency > 1
+                and len(neighbours) > 1):
+            workers = min(max_concurrency, len(neighbours))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                fetched = list(executor.map(fetch, neighbours))
+        else:
+            fetched = [fetch(neighbour) for neighbour in neighbours]
+        imports = [im for im in fetched if im is not None]
+        if not imports:
+            raise NoMatchingDataError
+        if len(imports) == 1:
+            df = imports[0].to_frame()
+        else:
+            # neighbour timestamps rarely align perfectly (DST, gaps), so
+            # assemble the frame from one index union and a single 2-D array
+            # instead of letting pd.concat align series pairwise
+            union_idx = imports[0].index
+            for im in imports[1:]:
+                union_idx = union_idx.union(im.index)
+            values = np.column_stack(
+                [im.reindex(union_idx).to_numpy() for im in imports])
+            df = pd.DataFrame(values, index=union_idx,
+                              columns=[im.name for im in imports])
+        # drop columns that contain only zero's; compare on the ndarray so
+        # no intermediate boolean frame is built
+        df = df.iloc[:, (df.to_numpy() != 0).any(axis=0)]
+        df = self._finalize(df, area, start, end)
         df['sum'] = df.sum(axis=1)
         if per_hour:
             df = df.resample('h').first()
@@ -2159,13 +2275,34 @@ class EntsoePandasClient(EntsoeRawClient):
         """Query the combination of both domestic generation and imports"""
         generation = self.query_generation(country_code=country_code, end=end,
                                            start=start, nett=True)
-        generation = generation.loc[:, (generation != 0).any(
-            axis=0)]  # drop columns that contain only zero's
+        # drop columns that contain only zero's
+        generation = generation.iloc[:, (generation.to_numpy() != 0).any(axis=0)]
         imports = self.query_import(country_code=country_code, start=start,
                                     end=end)
 
-        data = {f'Generation': generation, f'Import': imports}
-        df = pd.concat(data.values(), axis=1, keys=data.keys())
-        df = df.ffill()
-        df = df.truncate(before=start, after=end)
+        # align the two frames once, stack their values and label the
+        # result with a pre-built MultiIndex instead of concat's keys=
+        # machinery
+        union_idx = generation.index.union(imports.index)
+        generation = generation.reindex(union_idx)
+        imports = imports.reindex(union_idx)
+        cols = pd.MultiIndex.from_tuples(
+            [('Generation', c) for c in generation.columns]
+            + [('Import', c) for c in imports.columns])
+        df = pd.DataFrame(
+            np.hstack([generation.to_numpy(), imports.to_numpy()]),
+            index=union_idx, columns=cols)
+        arr = df.to_numpy()
+        if arr.dtype.kind == 'f':
+            # numpy forward-fill: carry the row number of the last valid
+            # value down each column, then fancy-index it back out
+            valid = np.where(~np.isnan(arr),
+                             np.arange(arr.shape[0])[:, None], 0)
+            np.maximum.accumulate(valid, axis=0, out=valid)
+            arr = arr[valid, np.arange(arr.shape[1])]
+            df = pd.DataFrame(arr, index=df.index, columns=df.columns)
+        else:
+            df = df.ffill()
+        # both inputs are already windowed to [start, end], so their
+        # union index is too; no final truncate needed
         return df
@@ -1,7 +1,11 @@
 import enum
+import functools
 from typing import Union
 
 
+# the key space is the fixed set of Area members, names and EIC codes,
+# so an unbounded cache stays small and never evicts
+@functools.lru_cache(maxsize=None)
 def lookup_area(s: Union['Area', str]) -> 'Area':
     if isinstance(s, Area):
         # If it already is an Area object, we're happy
@@ -12,7 +16,7 @@ def lookup_area(s: Union['Area', str]) -> 'Area':
             area = Area[s]
         except KeyError:
             # It is not, it may be a direct code
-            area = [area for area in Area if area.value == s][0]
+            area = _AREA_BY_CODE[s]
     return area
 
 
@@ -148,6 +152,15 @@ class Area(enum.Enum):
     XK =            '10Y1001C--00100H', 'Kosovo/ XK CA / XK BZN',                       'Europe/Rome',
     DE_AMP_LU =     '10Y1001C--00002H', 'Amprion LU CA',                                'Europe/Berlin'
 
+
+# several areas share an EIC code; keep the first definition, matching the
+# order a linear scan over the enum would find them in
+_AREA_BY_CODE = {}
+for _area in Area:
+    _AREA_BY_CODE.setdefault(_area.value, _area)
+del _area
+
+
 PSRTYPE_MAPPINGS = {
     'A03': 'Mixed',
     'A04': 'Generation',
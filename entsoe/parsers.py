@@ -1,7 +1,7 @@
 import sys
 import zipfile
 from io import BytesIO
-from typing import Union
+from typing import IO, Union
 import warnings
 import bs4
 from bs4.builder import XMLParsedAsHTMLWarning
@@ -16,6 +16,19 @@ warnings.filterwarnings('ignore', category=XMLParsedAsHTMLWarning)
 GENERATION_ELEMENT = "inBiddingZone_Domain.mRID"
 CONSUMPTION_ELEMENT = "outBiddingZone_Domain.mRID"
 
+# code tables shared by the balancing timeseries parsers; defined once at
+# module level instead of being rebuilt for every parsed timeseries
+_FLOW_DIRECTION = {
+    'A01': 'Up',
+    'A02': 'Down'
+}
+_RESERVE_TYPES = {
+    'A95': 'FCR',
+    'A96': 'aFRR',
+    'A97': 'mFRR',
+    'A98': 'RR'
+}
+
 
 
 def parse_prices(xml_text):
@@ -91,19 +104,24 @@ def parse_loads(xml_text, process_type='A01'):
             'Forecasted Load' if process_type == 'A01' else 'Actual Load': series
         })
     else:
-        series_min = pd.Series(dtype='object')
-        series_max = pd.Series(dtype='object')
+        # collect per-timeseries pieces and concat once at the end;
+        # seeding with an empty object series forced the result to object
+        # dtype and re-copied the accumulated data on every iteration
+        series_min = []
+        series_max = []
         for soup in _extract_timeseries(xml_text):
             t = _parse_load_timeseries(soup)
-            if soup.find('businesstype').text == 'A60':
-                series_min = pd.concat([series_min, t])
-            elif soup.find('businesstype').text == 'A61':
-                series_max = pd.concat([series_max, t])
-            else:
-                continue
+            business_type = soup.find('businesstype').text
+            if business_type == 'A60':
+                series_min.append(t)
+            elif business_type == 'A61':
+                series_max.append(t)
+        empty = pd.Series(dtype='float64')
         return pd.DataFrame({
-            'Min Forecasted Load': series_min,
-            'Max Forecasted Load': series_max
+            'Min Forecasted Load':
+                pd.concat(series_min) if series_min else empty,
+            'Max Forecasted Load':
+                pd.concat(series_max) if series_max else empty
         })
 
 
@@ -219,7 +237,17 @@ def parse_installed_capacity_per_plant(xml_text):
 
     df = pd.DataFrame.from_dict(all_series).T
     df['Production Type'] = df['Production Type'].map(PSRTYPE_MAPPINGS)
-    df['Name'] = df['Name'].str.encode('latin-1').str.decode('utf-8')
+    # historical responses decoded as latin-1 need the round-trip to
+    # repair mojibake; names that are already proper utf-8 (the common
+    # case now that the raw bytes are parsed directly) make it fail, so
+    # keep them as-is
+    def _fix_name(name):
+        try:
+            return name.encode('latin-1').decode('utf-8')
+        except (UnicodeEncodeError, UnicodeDecodeError):
+            return name
+
+    df['Name'] = df['Name'].map(_fix_name)
     #    df['Status'] = df['Status'].map(BSNTYPE)
     return df
 
@@ -361,27 +389,25 @@ def _parse_aggregated_bids_timeseries(soup):
     -------
     pd.DataFrame
     """
-    direction = {
-        'A01': 'Up',
-        'A02': 'Down'
-    }
-
-    flow_direction = direction[soup.find('flowdirection.direction').text]
+    flow_direction = _FLOW_DIRECTION[soup.find('flowdirection.direction').text]
     period = soup.find('period')
     start = pd.to_datetime(period.find('timeinterval').find('start').text)
     end = pd.to_datetime(period.find('timeinterval').find('end').text)
     resolution = _resolution_to_timedelta(period.find('resolution').text)
-    
+
     tx = pd.date_range(start=start, end=end, freq=resolution, inclusive='left')
-    df = pd.DataFrame(index=tx, columns=['Offered', 'Activated'])
-    
     points = period.find_all('point')
-    
-    for dt, point in zip(tx, points):
-        df.loc[dt, 'Offered'] = float(point.find('quantity').text)
-        activated = point.find('secondaryquantity')
-        if activated is not None:
-            df.loc[dt, 'Activated'] = float(activated.text)
+
+    # collect plain lists and build the frame in one go; assigning row by
+    # row with .loc pays the full indexing machinery per point
+    offered = []
+    activated = []
+    for point in points:
+        offered.append(float(point.find('quantity').text))
+        secondary = point.find('secondaryquantity')
+        activated.append(float(secondary.text) if secondary else None)
+    df = pd.DataFrame({'Offered': offered, 'Activated': activated},
+                      index=tx[:len(points)]).reindex(tx)
 
     mr_id = int(soup.find('mrid').text)
     df.columns = pd.MultiIndex.from_product(
@@ -402,23 +428,21 @@ def _parse_procured_balancing_capacity(soup, tz):
     -------
     pd.DataFrame
     """
-    direction = {
-        'A01': 'Up',
-        'A02': 'Down'
-    }
-
-    flow_direction = direction[soup.find('flowdirection.direction').text]
+    flow_direction = _FLOW_DIRECTION[soup.find('flowdirection.direction').text]
     period = soup.find('period')
     start = pd.to_datetime(period.find('timeinterval').find('start').text)
     end = pd.to_datetime(period.find('timeinterval').find('end').text)
     resolution = _resolution_to_timedelta(period.find('resolution').text)
     tx = pd.date_range(start=start, end=end, freq=resolution, inclusive='left')
     points = period.find_all('point')
-    df = pd.DataFrame(index=tx, columns=['Price', 'Volume'])
 
-    for dt, point in zip(tx, points):
-        df.loc[dt, 'Price'] = float(point.find('procurement_price.amount').text)
-        df.loc[dt, 'Volume'] = float(point.find('quantity').text)
+    prices = []
+    volumes = []
+    for point in points:
+        prices.append(float(point.find('procurement_price.amount').text))
+        volumes.append(float(point.find('quantity').text))
+    df = pd.DataFrame({'Price': prices, 'Volume': volumes},
+                      index=tx[:len(points)]).reindex(tx)
 
     mr_id = int(soup.find('mrid').text)
     df.columns = pd.MultiIndex.from_product(
@@ -509,8 +533,10 @@ def parse_imbalance_prices_zip(zip_contents: bytes) -> pd.DataFrame:
         with zipfile.ZipFile(BytesIO(archive), 'r') as arc:
             for f in arc.infolist():
                 if f.filename.endswith('xml'):
-                    frame = parse_imbalance_prices(xml_text=arc.read(f))
-                    yield frame
+                    # hand the member stream directly to the parser so the
+                    # decompressed bytes are not buffered a second time
+                    with arc.open(f) as xml_file:
+                        yield parse_imbalance_prices(xml_text=xml_file)
 
     frames = gen_frames(zip_contents)
     df = pd.concat(frames)
@@ -527,21 +553,8 @@ def _parse_activated_balancing_energy_prices_timeseries(soup) -> pd.DataFrame:
     -------
     pd.DataFrame
     """
-    direction_options = {
-        'A01': 'Up',
-        'A02': 'Down'
-    }
-
-    reserve_type_options = {
-        'A95': 'FCR',
-        'A96': 'aFRR',
-        'A97': 'mFRR',
-        'A98': 'RR'
-    }
-
-
-    flow_direction = direction_options[soup.find('flowdirection.direction').text]
-    reserve_type = reserve_type_options[soup.find('businesstype').text]
+    flow_direction = _FLOW_DIRECTION[soup.find('flowdirection.direction').text]
+    reserve_type = _RESERVE_TYPES[soup.find('businesstype').text]
     period = soup.find('period')
     start = pd.to_datetime(period.find('timeinterval').find('start').text)
     end = pd.to_datetime(period.find('timeinterval').find('end').text)
@@ -608,8 +621,8 @@ def parse_imbalance_volumes_zip(zip_contents: bytes) -> pd.DataFrame:
         with zipfile.ZipFile(BytesIO(archive), 'r') as arc:
             for f in arc.infolist():
                 if f.filename.endswith('xml'):
-                    frame = parse_imbalance_volumes(xml_text=arc.read(f))
-                    yield frame
+                    with arc.open(f) as xml_file:
+                        yield parse_imbalance_volumes(xml_text=xml_file)
 
     frames = gen_frames(zip_contents)
     df = pd.concat(frames)
@@ -638,8 +651,7 @@ def _parse_imbalance_volumes_timeseries(soup) -> pd.DataFrame:
         # time series uses positive and negative values
         flow_direction_factor = 1
 
-    df = pd.DataFrame(columns=['Imbalance Volume'])
-
+    pieces = []
     for period in soup.find_all('period'):
         start = pd.to_datetime(period.find('timeinterval').find('start').text)
         end = pd.to_datetime(period.find('timeinterval').find('end').text)
@@ -647,11 +659,15 @@ def _parse_imbalance_volumes_timeseries(soup) -> pd.DataFrame:
         tx = pd.date_range(start=start, end=end, freq=resolution, inclusive='left')
         points = period.find_all('point')
 
-        for dt, point in zip(tx, points):
-            df.loc[dt, 'Imbalance Volume'] = \
-                float(point.find('quantity').text) * flow_direction_factor
+        # one series per period instead of growing the frame row by row
+        values = [float(point.find('quantity').text) * flow_direction_factor
+                  for point in points]
+        pieces.append(pd.Series(values, index=tx[:len(points)]))
 
-    df.set_index(['Imbalance Volume'])
+    if pieces:
+        df = pd.concat(pieces).to_frame('Imbalance Volume')
+    else:
+        df = pd.DataFrame(columns=['Imbalance Volume'])
 
     return df
 
@@ -766,7 +782,7 @@ def _parse_installed_capacity_per_plant(soup):
                     # 'Status': 'businesstype',
                     'Voltage Connection Level [kV]':
                         'voltage_powersystemresources.highvoltagelimit'}
-    series = pd.Series(extract_vals).apply(lambda v: soup.find(v).text)
+    series = pd.Series({k: soup.find(v).text for k, v in extract_vals.items()})
 
     # extract only first point
     series['Installed Capacity [MW]'] = \
@@ -923,14 +939,20 @@ def parse_unavailabilities(response: bytes, doctype: str) -> pd.DataFrame:
     with zipfile.ZipFile(BytesIO(response), 'r') as arc:
         for f in arc.infolist():
             if f.filename.endswith('xml'):
-                frame = _outage_parser(arc.read(f), headers, ts_func)
-                dfs.append(frame)
+                with arc.open(f) as xml_file:
+                    dfs.append(_outage_parser(xml_file, headers, ts_func))
     if len(dfs) == 0:
         df = pd.DataFrame(columns=headers)
     else:
         df = pd.concat(dfs, axis=0)
     df.set_index('created_doc_time', inplace=True)
     df.sort_index(inplace=True)
+    # promote the period bounds from object columns of Timestamps to
+    # proper datetime64 columns, so downstream tz conversion and window
+    # comparisons stay vectorized
+    for col in ('start', 'end'):
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], utc=True)
     return df
 
 
@@ -945,10 +967,15 @@ def _available_period(timeseries: bs4.BeautifulSoup) -> list:
         yield [start, end, res, pstn, qty]
 
 
-def _outage_parser(xml_file: bytes, headers, ts_func) -> pd.DataFrame:
-    xml_text = xml_file.decode()
+def _outage_parser(xml_file: Union[bytes, IO], headers, ts_func) -> pd.DataFrame:
+    # member streams are read out in one go; the bytes are passed to
+    # BeautifulSoup as-is instead of paying for a full decode to str
+    xml_text = xml_file.read() if hasattr(xml_file, 'read') else xml_file
 
-    soup = bs4.BeautifulSoup(xml_text, 'html.parser')
+    # a single parse serves both the document headers and the timeseries
+    # blocks; outage documents can run into the tens of MBs, so building
+    # the tree twice was the dominant cost here
+    soup = bs4.BeautifulSoup(xml_text, 'lxml')
     mrid = soup.find("mrid").text
     revision_number = int(soup.find("revisionnumber").text)
     try:
@@ -961,8 +988,7 @@ def _outage_parser(xml_file: bytes, headers, ts_func) -> pd.DataFrame:
     except AttributeError:
         docstatus = None
     d = list()
-    series = _extract_timeseries(xml_text)
-    for ts in series:
+    for ts in soup.find_all('timeseries'):
         row = [creation_date, docstatus, mrid, revision_number]
         for t in ts_func(ts):
             d.append(row + t)
@@ -1,12 +1,17 @@
+import warnings
+
 import bs4
+from bs4.builder import XMLParsedAsHTMLWarning
 import pandas as pd
 
+warnings.filterwarnings('ignore', category=XMLParsedAsHTMLWarning)
+
 
 def _extract_timeseries(xml_text):
     """
     Parameters
     ----------
-    xml_text : str
+    xml_text : str | bytes
 
     Yields
     -------
@@ -14,24 +19,28 @@ def _extract_timeseries(xml_text):
     """
     if not xml_text:
         return
-    soup = bs4.BeautifulSoup(xml_text, 'html.parser')
+    # the lxml backend tokenizes multi-MB documents several times faster
+    # than the pure-python html.parser; tag names stay lowercased
+    soup = bs4.BeautifulSoup(xml_text, 'lxml')
     for timeseries in soup.find_all('timeseries'):
         yield timeseries
 
+_RESOLUTIONS = {
+    'PT60M': '60min',
+    'P1Y': '12M',
+    'PT15M': '15min',
+    'PT30M': '30min',
+    'P1D': '1D',
+    'P7D': '7D',
+    'P1M': '1M',
+}
+
+
 def _resolution_to_timedelta(res_text: str) -> str:
     """
     Convert an Entsoe resolution to something that pandas can understand
     """
-    resolutions = {
-        'PT60M': '60min',
-        'P1Y': '12M',
-        'PT15M': '15min',
-        'PT30M': '30min',
-        'P1D': '1D',
-        'P7D': '7D',
-        'P1M': '1M',
-    }
-    delta = resolutions.get(res_text)
+    delta = _RESOLUTIONS.get(res_text)
     if delta is None:
         raise NotImplementedError("Sorry, I don't know what to do with the "
                                   "resolution '{}', because there was no "
@@ -81,14 +90,21 @@ def _parse_datetimeindex(soup, tz=None):
 
 def _parse_timeseries_generic(soup, label='quantity', to_float=True):
     data = {}
-    for point in soup.find_all('point'):
-        value = point.find(label).text
-        if to_float:
-            value = value.replace(',', '')
-        data[int(point.find('position').text)] = value
+    if to_float:
+        # convert per point so the series is float64 from the start,
+        # instead of building an object series and copying it with astype
+        for point in soup.find_all('point'):
+            data[int(point.find('position').text)] = float(
+                point.find(label).text.replace(',', ''))
+    else:
+        for point in soup.find_all('point'):
+            data[int(point.find('position').text)] = point.find(label).text
 
     series = pd.Series(data)
-    series.sort_index()
+    if not series.index.is_monotonic_increasing:
+        # sort_index returns a copy, assigning it was forgotten before so
+        # out-of-order points stayed in document order
+        series = series.sort_index()
     index = _parse_datetimeindex(soup)
     if soup.find('curvetype').text == 'A03':
         # with A03 its possible that positions are missing, this is when values are repeated
@@ -98,8 +114,6 @@ def _parse_timeseries_generic(soup, label='quantity', to_float=True):
         series = series.reindex(list(range(1, len(index)+1))).ffill()
 
     series.index = index
-    if to_float:
-        series = series.astype(float)
 
     return series
 
@@ -38,7 +38,7 @@ class EntsoeRawClientTest(unittest.TestCase):
         for query in queries:
             text = query(country_code=self.country_code, start=self.start,
                          end=self.end)
-            self.assertIsInstance(text, str)
+            self.assertIsInstance(text, bytes)
             try:
                 BeautifulSoup(text, 'html.parser')
             except Exception as e:
@@ -48,7 +48,7 @@ class EntsoeRawClientTest(unittest.TestCase):
         text = self.client.query_crossborder_flows(
             country_code_from='BE', country_code_to='NL', start=self.start,
             end=self.end)
-        self.assertIsInstance(text, str)
+        self.assertIsInstance(text, bytes)
         try:
             BeautifulSoup(text, 'html.parser')
         except Exception as e: